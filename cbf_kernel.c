@@ -0,0 +1,194 @@
+/*
+ * cbf_kernel.c - fixed-point BGR color transform kernel for trueBlinders.
+ *
+ * Applies a 3x3 color matrix (Q10 fixed point, row-major int16) to a
+ * stream of interleaved BGR uint8 pixels with round-to-nearest and
+ * saturation to [0, 255].
+ *
+ * The implementation is selected once at load time: an AVX2 kernel that
+ * deinterleaves 32 pixels into planar registers, does the multiply-adds
+ * as int16 pairs with _mm256_madd_epi16, and packs back with saturating
+ * casts; or a portable scalar fallback. Dispatch uses
+ * __builtin_cpu_supports so one shared object runs everywhere.
+ *
+ * Build:  cc -O3 -shared -fPIC cbf_kernel.c -o cbf_kernel.so
+ * (trueBlinders.py attempts this automatically when the .so is missing.)
+ */
+
+#include <stdint.h>
+
+#define FIXED_SHIFT 10
+#define FIXED_HALF (1 << (FIXED_SHIFT - 1))
+
+typedef void (*transform_fn)(const uint8_t *, uint8_t *, int64_t,
+                             const int16_t *);
+
+static void transform_scalar(const uint8_t *src, uint8_t *dst, int64_t n,
+                             const int16_t *m)
+{
+    int64_t i;
+    int c;
+
+    for (i = 0; i < n; i++) {
+        int32_t b = src[0], g = src[1], r = src[2];
+
+        for (c = 0; c < 3; c++) {
+            int32_t v = (m[3 * c] * b + m[3 * c + 1] * g + m[3 * c + 2] * r +
+                         FIXED_HALF) >> FIXED_SHIFT;
+            dst[c] = v < 0 ? 0 : (v > 255 ? 255 : (uint8_t)v);
+        }
+        src += 3;
+        dst += 3;
+    }
+}
+
+#if defined(__x86_64__) || defined(__i386__)
+
+#include <immintrin.h>
+
+/* Same 16-byte shuffle pattern in both 128-bit lanes: vpshufb never
+ * crosses lanes, so each lane independently handles 16 pixels. */
+#define DUP16(...) _mm256_setr_epi8(__VA_ARGS__, __VA_ARGS__)
+#define OR3(a, b, c) _mm256_or_si256(_mm256_or_si256((a), (b)), (c))
+
+__attribute__((target("avx2")))
+static inline __m256i channel_q(__m256i bg_pairs, __m256i r1_pairs,
+                                __m256i coef_bg, __m256i coef_r1)
+{
+    /* (b*mb + g*mg) + (r*mr + FIXED_HALF), then the fixed-point shift. */
+    return _mm256_srai_epi32(
+        _mm256_add_epi32(_mm256_madd_epi16(bg_pairs, coef_bg),
+                         _mm256_madd_epi16(r1_pairs, coef_r1)),
+        FIXED_SHIFT);
+}
+
+__attribute__((target("avx2")))
+static void transform_avx2(const uint8_t *src, uint8_t *dst, int64_t n,
+                           const int16_t *m)
+{
+    /* BGR deinterleave: plane byte p comes from one of three 16-byte
+     * source chunks; OR the three shuffles together. */
+    const __m256i mB0 = DUP16(0, 3, 6, 9, 12, 15, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1);
+    const __m256i mB1 = DUP16(-1, -1, -1, -1, -1, -1, 2, 5, 8, 11, 14, -1, -1, -1, -1, -1);
+    const __m256i mB2 = DUP16(-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1, 4, 7, 10, 13);
+    const __m256i mG0 = DUP16(1, 4, 7, 10, 13, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1);
+    const __m256i mG1 = DUP16(-1, -1, -1, -1, -1, 0, 3, 6, 9, 12, 15, -1, -1, -1, -1, -1);
+    const __m256i mG2 = DUP16(-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 2, 5, 8, 11, 14);
+    const __m256i mR0 = DUP16(2, 5, 8, 11, 14, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1);
+    const __m256i mR1 = DUP16(-1, -1, -1, -1, -1, 1, 4, 7, 10, 13, -1, -1, -1, -1, -1, -1);
+    const __m256i mR2 = DUP16(-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0, 3, 6, 9, 12, 15);
+
+    /* Planar -> interleaved BGR for the three 16-byte output chunks. */
+    const __m256i iB0 = DUP16(0, -1, -1, 1, -1, -1, 2, -1, -1, 3, -1, -1, 4, -1, -1, 5);
+    const __m256i iG0 = DUP16(-1, 0, -1, -1, 1, -1, -1, 2, -1, -1, 3, -1, -1, 4, -1, -1);
+    const __m256i iR0 = DUP16(-1, -1, 0, -1, -1, 1, -1, -1, 2, -1, -1, 3, -1, -1, 4, -1);
+    const __m256i iB1 = DUP16(-1, -1, 6, -1, -1, 7, -1, -1, 8, -1, -1, 9, -1, -1, 10, -1);
+    const __m256i iG1 = DUP16(5, -1, -1, 6, -1, -1, 7, -1, -1, 8, -1, -1, 9, -1, -1, 10);
+    const __m256i iR1 = DUP16(-1, 5, -1, -1, 6, -1, -1, 7, -1, -1, 8, -1, -1, 9, -1, -1);
+    const __m256i iB2 = DUP16(-1, 11, -1, -1, 12, -1, -1, 13, -1, -1, 14, -1, -1, 15, -1, -1);
+    const __m256i iG2 = DUP16(-1, -1, 11, -1, -1, 12, -1, -1, 13, -1, -1, 14, -1, -1, 15, -1);
+    const __m256i iR2 = DUP16(10, -1, -1, 11, -1, -1, 12, -1, -1, 13, -1, -1, 14, -1, -1, 15);
+
+    /* madd coefficient pairs: (mb, mg) for the b/g term, (mr, FIXED_HALF)
+     * for the r term, which folds the rounding bias in for free. */
+#define COEF_BG(row) _mm256_set1_epi32(((int32_t)(uint16_t)m[3 * (row) + 1] << 16) | (uint16_t)m[3 * (row)])
+#define COEF_R1(row) _mm256_set1_epi32(((int32_t)FIXED_HALF << 16) | (uint16_t)m[3 * (row) + 2])
+    const __m256i cbg0 = COEF_BG(0), cr0 = COEF_R1(0);
+    const __m256i cbg1 = COEF_BG(1), cr1 = COEF_R1(1);
+    const __m256i cbg2 = COEF_BG(2), cr2 = COEF_R1(2);
+#undef COEF_BG
+#undef COEF_R1
+
+    const __m256i zero = _mm256_setzero_si256();
+    const __m256i ones = _mm256_set1_epi16(1);
+    int64_t i;
+
+    /* 32 pixels (96 bytes) per iteration: lane 0 holds pixels 0-15 of the
+     * group, lane 1 pixels 16-31, so every shuffle stays in-lane. */
+    for (i = 0; i + 32 <= n; i += 32, src += 96, dst += 96) {
+        __m256i x0 = _mm256_loadu2_m128i((const __m128i *)(src + 48),
+                                         (const __m128i *)(src));
+        __m256i x1 = _mm256_loadu2_m128i((const __m128i *)(src + 64),
+                                         (const __m128i *)(src + 16));
+        __m256i x2 = _mm256_loadu2_m128i((const __m128i *)(src + 80),
+                                         (const __m128i *)(src + 32));
+
+        __m256i b = OR3(_mm256_shuffle_epi8(x0, mB0),
+                        _mm256_shuffle_epi8(x1, mB1),
+                        _mm256_shuffle_epi8(x2, mB2));
+        __m256i g = OR3(_mm256_shuffle_epi8(x0, mG0),
+                        _mm256_shuffle_epi8(x1, mG1),
+                        _mm256_shuffle_epi8(x2, mG2));
+        __m256i r = OR3(_mm256_shuffle_epi8(x0, mR0),
+                        _mm256_shuffle_epi8(x1, mR1),
+                        _mm256_shuffle_epi8(x2, mR2));
+
+        __m256i b_lo = _mm256_unpacklo_epi8(b, zero);
+        __m256i b_hi = _mm256_unpackhi_epi8(b, zero);
+        __m256i g_lo = _mm256_unpacklo_epi8(g, zero);
+        __m256i g_hi = _mm256_unpackhi_epi8(g, zero);
+        __m256i r_lo = _mm256_unpacklo_epi8(r, zero);
+        __m256i r_hi = _mm256_unpackhi_epi8(r, zero);
+
+        /* Pair up (b, g) and (r, 1) once; shared by all three rows. */
+        __m256i bg0 = _mm256_unpacklo_epi16(b_lo, g_lo);
+        __m256i bg1 = _mm256_unpackhi_epi16(b_lo, g_lo);
+        __m256i bg2 = _mm256_unpacklo_epi16(b_hi, g_hi);
+        __m256i bg3 = _mm256_unpackhi_epi16(b_hi, g_hi);
+        __m256i r10 = _mm256_unpacklo_epi16(r_lo, ones);
+        __m256i r11 = _mm256_unpackhi_epi16(r_lo, ones);
+        __m256i r12 = _mm256_unpacklo_epi16(r_hi, ones);
+        __m256i r13 = _mm256_unpackhi_epi16(r_hi, ones);
+
+        /* packs/packus saturate, providing the clamp to [0, 255]. */
+#define ROW_OUT(out, cbg, cr)                                              \
+        do {                                                               \
+            __m256i sa = _mm256_packs_epi32(channel_q(bg0, r10, cbg, cr),  \
+                                            channel_q(bg1, r11, cbg, cr)); \
+            __m256i sb = _mm256_packs_epi32(channel_q(bg2, r12, cbg, cr),  \
+                                            channel_q(bg3, r13, cbg, cr)); \
+            out = _mm256_packus_epi16(sa, sb);                             \
+        } while (0)
+        __m256i ob, og, orr;
+        ROW_OUT(ob, cbg0, cr0);
+        ROW_OUT(og, cbg1, cr1);
+        ROW_OUT(orr, cbg2, cr2);
+#undef ROW_OUT
+
+        __m256i y0 = OR3(_mm256_shuffle_epi8(ob, iB0),
+                         _mm256_shuffle_epi8(og, iG0),
+                         _mm256_shuffle_epi8(orr, iR0));
+        __m256i y1 = OR3(_mm256_shuffle_epi8(ob, iB1),
+                         _mm256_shuffle_epi8(og, iG1),
+                         _mm256_shuffle_epi8(orr, iR1));
+        __m256i y2 = OR3(_mm256_shuffle_epi8(ob, iB2),
+                         _mm256_shuffle_epi8(og, iG2),
+                         _mm256_shuffle_epi8(orr, iR2));
+
+        _mm256_storeu2_m128i((__m128i *)(dst + 48), (__m128i *)(dst), y0);
+        _mm256_storeu2_m128i((__m128i *)(dst + 64), (__m128i *)(dst + 16), y1);
+        _mm256_storeu2_m128i((__m128i *)(dst + 80), (__m128i *)(dst + 32), y2);
+    }
+
+    if (i < n)
+        transform_scalar(src, dst, n - i, m);
+}
+
+#endif /* x86 */
+
+static transform_fn active_impl = transform_scalar;
+
+__attribute__((constructor))
+static void select_impl(void)
+{
+#if defined(__x86_64__) || defined(__i386__)
+    if (__builtin_cpu_supports("avx2"))
+        active_impl = transform_avx2;
+#endif
+}
+
+void cbf_transform_bgr_u8(const uint8_t *src, uint8_t *dst, int64_t n_pixels,
+                          const int16_t *m)
+{
+    active_impl(src, dst, n_pixels, m);
+}
@@ -3,9 +3,23 @@ from tkinter import filedialog, messagebox
 import cv2
 import numpy as np
 import threading
+import queue
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import ctypes
+import shutil
+import subprocess
 
-# Define colorblindness transformation matrices
+# Numba is optional: when available the per-pixel transform runs as a
+# JIT-compiled parallel kernel, otherwise we fall back to cv2.transform.
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+# Define colorblindness transformation matrices (in RGB channel order)
 COLORBLINDNESS_MATRICES = {
     "Protanopia": np.array([
         [0.567, 0.433, 0.000],
@@ -24,30 +38,334 @@ COLORBLINDNESS_MATRICES = {
     ])
 }
 
-def apply_colorblind_filter(frame, matrix):
+# Fixed-point format for the integer transform kernel: coefficients are
+# scaled by 2**10 and the products shifted back down, so the per-pixel math
+# is int32 multiply-adds instead of float64 with its 8x memory footprint.
+# The matrix coefficients carry 3 decimal digits, well within Q10 precision.
+_FIXED_SHIFT = 10
+_FIXED_ONE = 1 << _FIXED_SHIFT
+_FIXED_HALF = 1 << (_FIXED_SHIFT - 1)
+
+# Row-tile height for the JIT kernel. 64 rows of 1080p are ~740 KB of
+# source plus destination, which stays resident in L2 on common parts, and
+# tiles also give the parallel scheduler coarser work units than single
+# rows. Only matters once more per-pixel stages are fused into the kernel;
+# a single fused pass is one read and one write per pixel either way.
+_TILE_ROWS = 64
+
+# Number of frames transformed per call in the pipeline's compute stage.
+# Large enough to amortize per-call dispatch overhead, small enough that a
+# batch of 1080p frames stays cache/memory friendly.
+FRAME_BATCH_SIZE = 8
+
+# Permutation that swaps the R and B channels. Conjugating an RGB matrix with
+# it (P @ M @ P) yields the equivalent matrix for BGR pixels, so frames can be
+# transformed directly in OpenCV's native BGR layout with no cvtColor round
+# trip. Stored as contiguous float32, the layout cv2.transform wants.
+_RGB_TO_BGR_PERM = np.array([
+    [0, 0, 1],
+    [0, 1, 0],
+    [1, 0, 0]
+])
+
+COLORBLINDNESS_MATRICES_BGR = {
+    name: np.ascontiguousarray(
+        _RGB_TO_BGR_PERM @ matrix @ _RGB_TO_BGR_PERM, dtype=np.float32
+    )
+    for name, matrix in COLORBLINDNESS_MATRICES.items()
+}
+
+def _quantize_matrix(matrix_bgr):
+    """Return the matrix in Q10 fixed point (coefficients * 1024, int16)."""
+    return np.round(matrix_bgr * _FIXED_ONE).astype(np.int16)
+
+if _HAVE_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _transform_numba(frame, matrix_q, out):
+        """Fused fixed-point load/matmul/clip/store kernel over row tiles."""
+        height, width = frame.shape[:2]
+        n_tiles = (height + _TILE_ROWS - 1) // _TILE_ROWS
+        for t in prange(n_tiles):
+            y_stop = min((t + 1) * _TILE_ROWS, height)
+            for y in range(t * _TILE_ROWS, y_stop):
+                for x in range(width):
+                    b = np.int32(frame[y, x, 0])
+                    g = np.int32(frame[y, x, 1])
+                    r = np.int32(frame[y, x, 2])
+                    for c in range(3):
+                        value = (matrix_q[c, 0] * b + matrix_q[c, 1] * g
+                                 + matrix_q[c, 2] * r + _FIXED_HALF) >> _FIXED_SHIFT
+                        out[y, x, c] = min(255, max(0, value))
+
+def _load_native_kernel():
+    """
+    Load the optional native transform kernel (see cbf_kernel.c), building
+    it with the system compiler the first time if only the source is
+    present. The kernel picks an AVX2 or scalar implementation at load
+    time based on the CPU. Returns the ctypes function, or None when no
+    library or compiler is available; callers then fall back to the
+    Numba/OpenCV paths.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    lib_path = os.path.join(here, "cbf_kernel.so")
+    if not os.path.exists(lib_path):
+        src_path = os.path.join(here, "cbf_kernel.c")
+        if not os.path.exists(src_path):
+            return None
+        try:
+            subprocess.run(
+                ["cc", "-O3", "-shared", "-fPIC", src_path, "-o", lib_path],
+                check=True, capture_output=True
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return None
+    try:
+        lib = ctypes.CDLL(lib_path)
+    except OSError:
+        return None
+    kernel = lib.cbf_transform_bgr_u8
+    kernel.argtypes = [
+        ctypes.POINTER(ctypes.c_uint8),   # src pixels, interleaved BGR
+        ctypes.POINTER(ctypes.c_uint8),   # dst pixels
+        ctypes.c_int64,                   # pixel count
+        ctypes.POINTER(ctypes.c_int16),   # 3x3 matrix, Q10, row-major
+    ]
+    kernel.restype = None
+    return kernel
+
+_NATIVE_KERNEL = _load_native_kernel()
+
+# The native and cv2.transform kernels are single-threaded, so the compute
+# stage farms horizontal strips of each batch to this pool; both kernels
+# release the GIL, so strips genuinely run on separate cores. The Numba
+# kernel parallelizes internally via prange and bypasses the pool.
+_POOL_WORKERS = os.cpu_count() or 1
+_transform_pool = ThreadPoolExecutor(max_workers=_POOL_WORKERS)
+_PARALLELIZE_STRIPS = _NATIVE_KERNEL is not None or not _HAVE_NUMBA
+
+def _transform_strips(frame, matrix_bgr, dst, matrix_q=None):
+    """
+    Apply the filter with rows split into one strip per pool worker.
+
+    frame and dst must be C-contiguous so each strip view is too. Falls
+    through to a single apply_colorblind_filter call when the active
+    kernel already parallelizes or the image is too short to split.
+    """
+    rows = frame.shape[0]
+    if not _PARALLELIZE_STRIPS or rows < 2 * _POOL_WORKERS:
+        return apply_colorblind_filter(frame, matrix_bgr, dst=dst,
+                                       matrix_q=matrix_q)
+    bounds = np.linspace(0, rows, _POOL_WORKERS + 1).astype(int)
+    futures = [
+        _transform_pool.submit(
+            apply_colorblind_filter, frame[lo:hi], matrix_bgr, dst[lo:hi],
+            matrix_q
+        )
+        for lo, hi in zip(bounds[:-1], bounds[1:])
+    ]
+    for future in futures:
+        future.result()
+    return dst
+
+# H.264 encoders to try for output, hardware first. libx264 is last: still
+# better than OpenCV's software MPEG-4 Part 2, but no offload.
+_FFMPEG_ENCODERS = ("h264_nvenc", "h264_qsv", "h264_videotoolbox", "libx264")
+
+_FFMPEG_ENCODER_UNSET = object()
+_ffmpeg_encoder = _FFMPEG_ENCODER_UNSET
+
+def _probe_ffmpeg_encoder():
+    """
+    Return the name of the first working H.264 encoder from
+    _FFMPEG_ENCODERS, or None when FFmpeg is absent or none of them can
+    encode on this machine. Each candidate is verified by encoding one
+    dummy frame, since e.g. h264_nvenc is often listed by builds that have
+    no NVIDIA device to run it on. The result is cached per process.
+    """
+    global _ffmpeg_encoder
+    if _ffmpeg_encoder is not _FFMPEG_ENCODER_UNSET:
+        return _ffmpeg_encoder
+    _ffmpeg_encoder = None
+    if shutil.which("ffmpeg") is not None:
+        for encoder in _FFMPEG_ENCODERS:
+            try:
+                result = subprocess.run(
+                    ["ffmpeg", "-hide_banner", "-loglevel", "error",
+                     "-f", "lavfi", "-i", "color=black:size=64x64:rate=30",
+                     "-frames:v", "1", "-c:v", encoder, "-f", "null", "-"],
+                    capture_output=True, timeout=15
+                )
+            except (OSError, subprocess.SubprocessError):
+                break
+            if result.returncode == 0:
+                _ffmpeg_encoder = encoder
+                break
+    return _ffmpeg_encoder
+
+class _FFmpegWriter:
+    """
+    cv2.VideoWriter-compatible writer that pipes raw BGR frames into an
+    FFmpeg subprocess. With a hardware encoder (NVENC/QSV/VideoToolbox)
+    the encode runs off-CPU, leaving the cores to decode and transform;
+    the H.264 output is also far smaller than OpenCV's mp4v.
+    """
+
+    def __init__(self, output_path, fps, width, height, encoder):
+        command = [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+            "-f", "rawvideo", "-pix_fmt", "bgr24",
+            "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+            "-c:v", encoder,
+        ]
+        if encoder == "h264_nvenc":
+            command += ["-preset", "p4"]
+        command += ["-pix_fmt", "yuv420p", output_path]
+        self._proc = subprocess.Popen(command, stdin=subprocess.PIPE)
+
+    def write(self, frame):
+        self._proc.stdin.write(frame.tobytes())
+
+    def release(self):
+        self._proc.stdin.close()
+        self._proc.wait()
+
+def _open_video_writer(output_path, fps, width, height):
+    """
+    Open the output video, preferring an FFmpeg pipe with a (hardware)
+    H.264 encoder and falling back to OpenCV's software mp4v writer.
+
+    H.264 encoders in yuv420p reject odd widths and heights, while mp4v
+    handles them fine, so odd-sized videos keep the cv2 writer instead of
+    being padded or scaled to dimensions the caller did not ask for.
+    """
+    if width % 2 == 0 and height % 2 == 0:
+        encoder = _probe_ffmpeg_encoder()
+        if encoder is not None:
+            try:
+                return _FFmpegWriter(output_path, fps, width, height, encoder)
+            except OSError:
+                pass
+    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+    return cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+
+def _make_lut_transform(matrix_bgr, tolerance=1e-3):
+    """
+    Build a per-channel 256-entry lookup-table fast path, or return None
+    when the matrix actually mixes channels.
+
+    A per-channel LUT can only express out_c = f(in_c), so this is exact
+    precisely when the off-diagonal coefficients vanish. The shipped
+    colorblindness matrices all mix channels, but compositions and future
+    filters (gamma, per-channel gain) need not; for those, cv2.LUT reduces
+    the whole transform to one cache-resident table lookup per pixel. The
+    returned callable matches apply_colorblind_filter(frame, dst=...).
+    """
+    off_diagonal = matrix_bgr - np.diag(np.diag(matrix_bgr))
+    if np.abs(off_diagonal).max() > tolerance:
+        return None
+    levels = np.arange(256, dtype=np.float32)
+    lut = np.stack(
+        [np.clip(levels * matrix_bgr[c, c] + 0.5, 0, 255).astype(np.uint8)
+         for c in range(3)],
+        axis=-1
+    ).reshape(1, 256, 3)
+
+    def transform(frame, dst=None):
+        return cv2.LUT(frame, lut, dst)
+
+    return transform
+
+def _make_cuda_transform(matrix_bgr):
+    """
+    Build a CUDA-backed frame transform via cv2.cuda, or return None when
+    there is no CUDA device or the OpenCV build lacks the cuda modules.
+
+    The per-pixel 3x3 map is run as a GEMM on the (H*W, 3) pixel matrix on
+    the device, which moves the whole transform off the CPU; the CPU then
+    only pays the float32 staging copies around upload/download. The
+    returned callable matches apply_colorblind_filter(frame, dst=...).
+    """
+    try:
+        if cv2.cuda.getCudaEnabledDeviceCount() <= 0:
+            return None
+
+        gpu_matrix = cv2.cuda_GpuMat()
+        gpu_matrix.upload(np.ascontiguousarray(matrix_bgr.T, dtype=np.float32))
+
+        def transform(frame, dst=None):
+            gpu_pixels = cv2.cuda_GpuMat()
+            gpu_pixels.upload(frame.reshape(-1, 3).astype(np.float32))
+            result = cv2.cuda.gemm(gpu_pixels, gpu_matrix, 1.0, None, 0.0).download()
+            np.clip(result, 0, 255, out=result)
+            # Round to nearest before the uint8 cast truncates, matching
+            # the half-bias/saturate rounding of the CPU paths.
+            np.rint(result, out=result)
+            out = dst if dst is not None else np.empty_like(frame)
+            out[...] = result.reshape(frame.shape)
+            return out
+
+        # Probe once on a dummy frame so a present-but-broken CUDA runtime
+        # degrades to the CPU paths instead of failing mid-video.
+        transform(np.zeros((4, 4, 3), dtype=np.uint8))
+        return transform
+    except (AttributeError, cv2.error):
+        return None
+
+def _warmup_transform(matrix_bgr):
+    """
+    Run the transform once on a dummy frame so Numba's JIT compilation cost
+    is paid before frame processing (and the progress timer) starts.
+    """
+    if _HAVE_NUMBA:
+        apply_colorblind_filter(np.zeros((2, 2, 3), dtype=np.uint8), matrix_bgr)
+
+def apply_colorblind_filter(frame, matrix_bgr, dst=None, matrix_q=None):
     """
     Apply the colorblindness filter to a single frame.
-    
+
     Parameters:
         frame (numpy.ndarray): The input video frame in BGR format.
-        matrix (numpy.ndarray): The color transformation matrix.
-        
+        matrix_bgr (numpy.ndarray): The BGR color transformation matrix
+            (an entry of COLORBLINDNESS_MATRICES_BGR, or a composition of
+            them).
+        dst (numpy.ndarray): Optional preallocated output array of the
+            same shape and dtype as frame, filled in place. Reusing one
+            avoids a multi-megabyte allocation per call.
+        matrix_q (numpy.ndarray): Optional Q10 fixed-point form of
+            matrix_bgr (from _quantize_matrix). Callers in a loop should
+            quantize once and pass it in; otherwise it is derived here.
+
     Returns:
-        numpy.ndarray: The colorblindness filtered frame in BGR format.
+        numpy.ndarray: The colorblindness filtered frame in BGR format
+        (dst when it was given).
     """
-    # Convert BGR to RGB
-    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    
-    # Apply the transformation matrix
-    transformed = np.dot(rgb_frame, matrix.T)
-    
-    # Clip values to [0, 255] and convert to uint8
-    transformed = np.clip(transformed, 0, 255).astype(np.uint8)
-    
-    # Convert back to BGR
-    bgr_transformed = cv2.cvtColor(transformed, cv2.COLOR_RGB2BGR)
-    
-    return bgr_transformed
+    # Frames stay in OpenCV's interleaved BGR layout end to end. The SIMD
+    # benefit of planar (SoA) channels is had in-register instead: the
+    # native kernel shuffle-deinterleaves each block of pixels into planar
+    # vectors, computes, and re-interleaves on store, while cv2.transform
+    # uses equivalent kernels internally. A frame-level cv2.split/merge
+    # would buy the same contiguous loads at the cost of two extra full
+    # passes over the image.
+    if matrix_q is None:
+        matrix_q = _quantize_matrix(matrix_bgr)
+    if (_NATIVE_KERNEL is not None and frame.flags['C_CONTIGUOUS']
+            and (dst is None or dst.flags['C_CONTIGUOUS'])):
+        out = dst if dst is not None else np.empty_like(frame)
+        _NATIVE_KERNEL(
+            frame.ctypes.data_as(ctypes.POINTER(ctypes.c_uint8)),
+            out.ctypes.data_as(ctypes.POINTER(ctypes.c_uint8)),
+            frame.size // 3,
+            matrix_q.ctypes.data_as(ctypes.POINTER(ctypes.c_int16)),
+        )
+        return out
+    if _HAVE_NUMBA:
+        out = dst if dst is not None else np.empty_like(frame)
+        _transform_numba(frame, matrix_q, out)
+        return out
+    # cv2.transform runs the 3x3 matrix through OpenCV's vectorized kernels
+    # and saturate-casts back to uint8, so the frame never gets promoted to
+    # a float temporary and no separate clip/astype passes are needed.
+    return cv2.transform(frame, matrix_bgr, dst)
 
 def process_video(input_path, output_path, filters, progress_callback):
     """
@@ -60,6 +378,25 @@ def process_video(input_path, output_path, filters, progress_callback):
         progress_callback (function): Function to update the progress bar.
     """
     try:
+        # With no filters the output equals the input: remux (or byte-copy)
+        # it instead of decoding and re-encoding, which is orders of
+        # magnitude faster and lossless. The UI currently refuses an empty
+        # selection, but the engine should not depend on that guard.
+        if not filters:
+            copied = False
+            if shutil.which("ffmpeg") is not None:
+                result = subprocess.run(
+                    ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+                     "-i", input_path, "-c", "copy", output_path],
+                    capture_output=True
+                )
+                copied = result.returncode == 0
+            if not copied:
+                shutil.copyfile(input_path, output_path)
+            progress_callback(100)
+            messagebox.showinfo("Success", f"Filtered video saved to:\n{output_path}")
+            return
+
         # Open the input video
         cap = cv2.VideoCapture(input_path)
         if not cap.isOpened():
@@ -72,41 +409,169 @@ def process_video(input_path, output_path, filters, progress_callback):
         height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
         total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
         
-        # Define the codec and create VideoWriter object
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+        # Create the output writer (FFmpeg/H.264 when available, mp4v otherwise)
+        out = _open_video_writer(output_path, fps, width, height)
         
         # Get the transformation matrices
         matrices = []
         for filter_type in filters:
-            matrix = COLORBLINDNESS_MATRICES.get(filter_type)
+            matrix = COLORBLINDNESS_MATRICES_BGR.get(filter_type)
             if matrix is None:
                 messagebox.showerror("Error", f"Unknown filter type: {filter_type}")
                 cap.release()
                 out.release()
                 return
             matrices.append(matrix)
-        
-        # Process each frame
-        frame_num = 0
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            
-            # Apply each selected filter in sequence
-            filtered_frame = frame
-            for matrix in matrices:
-                filtered_frame = apply_colorblind_filter(filtered_frame, matrix)
-            
-            # Write the frame to the output video
-            out.write(filtered_frame)
-            
-            frame_num += 1
-            if frame_num % 10 == 0 or frame_num == total_frames:
-                progress = (frame_num / total_frames) * 100
-                progress_callback(progress)
-        
+
+        # Fuse the selected filters into a single 3x3 matrix. Each filter is
+        # linear in pixel values, so applying M1 then M2 equals applying
+        # M2 @ M1. One transform per frame instead of one per filter, with a
+        # single final saturation (the cascaded per-filter clips only
+        # differed on already out-of-gamut intermediates).
+        combined = matrices[0]
+        for matrix in matrices[1:]:
+            combined = matrix @ combined
+        combined = np.ascontiguousarray(combined, dtype=np.float32)
+        combined_q = _quantize_matrix(combined)
+        _warmup_transform(combined)
+        # Cheapest applicable transform wins: a separable matrix becomes a
+        # pure table lookup, then the GPU, then the CPU kernel chain.
+        lut_transform = _make_lut_transform(combined)
+        cuda_transform = _make_cuda_transform(combined) if lut_transform is None else None
+
+        # Run decode, transform, and encode as a three-stage pipeline so the
+        # CPU transform overlaps with the reader's decode and the writer's
+        # encode instead of serializing behind them. The bounded queues cap
+        # memory use and let the fastest stage run ahead without unbounded
+        # buffering; a None sentinel marks end of stream on each queue.
+        read_q = queue.Queue(maxsize=16)
+        # The writer gets a deeper queue than the reader: encode time is
+        # bursty (rate control, container flushes), and 64 frames of slack
+        # let compute run through short encoder stalls without
+        # backpressure.
+        write_q = queue.Queue(maxsize=64)
+        errors = []
+        # [batches that found the write queue near capacity, total batches]
+        backpressure = [0, 0]
+
+        def read_frames():
+            try:
+                while True:
+                    # grab() only advances the demuxer; the (expensive)
+                    # YUV->BGR decode happens in retrieve(). Full processing
+                    # retrieves every frame, but the split means any future
+                    # sampling mode (preview every Nth frame, early cancel)
+                    # can skip decode entirely for dropped frames.
+                    if not cap.grab():
+                        break
+                    ret, frame = cap.retrieve()
+                    if not ret:
+                        break
+                    read_q.put(frame)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                read_q.put(None)
+
+        def transform_frames():
+            # Accumulate frames into one preallocated buffer and transform
+            # the whole batch with a single call: the per-call dispatch cost
+            # is amortized and the kernel gets a much larger contiguous
+            # image to stream through.
+            batch = np.empty((FRAME_BATCH_SIZE, height, width, 3), dtype=np.uint8)
+            # Output batches come from a small pool recycled round-robin
+            # rather than a fresh allocation per batch. The pool is sized
+            # from the write queue depth so a buffer is only reused after
+            # more frames than can still reference it (maxsize queued plus
+            # one in the writer's hands) have been pushed; no frame is
+            # overwritten before it is encoded.
+            pool_size = write_q.maxsize // FRAME_BATCH_SIZE + 2
+            out_pool = [np.empty_like(batch) for _ in range(pool_size)]
+            batch_index = 0
+            try:
+                eof = False
+                while not eof:
+                    count = 0
+                    while count < FRAME_BATCH_SIZE:
+                        frame = read_q.get()
+                        if frame is None:
+                            eof = True
+                            break
+                        batch[count] = frame
+                        count += 1
+                    if count == 0:
+                        break
+                    # A (count*H, W, 3) view of the batch is itself a valid
+                    # tall image, so one transform covers every frame in it.
+                    out_batch = out_pool[batch_index % len(out_pool)]
+                    batch_index += 1
+                    backpressure[1] += 1
+                    if write_q.qsize() >= write_q.maxsize - FRAME_BATCH_SIZE:
+                        backpressure[0] += 1
+                    flat = batch[:count].reshape(-1, width, 3)
+                    out_flat = out_batch[:count].reshape(-1, width, 3)
+                    if lut_transform is not None:
+                        lut_transform(flat, dst=out_flat)
+                    elif cuda_transform is not None:
+                        cuda_transform(flat, dst=out_flat)
+                    else:
+                        _transform_strips(flat, combined, out_flat,
+                                          matrix_q=combined_q)
+                    for i in range(count):
+                        write_q.put(out_batch[i])
+            except Exception as e:
+                errors.append(e)
+                # Keep draining so the reader never blocks on a full queue
+                # -- unless its sentinel was already consumed (eof), in
+                # which case the queue stays empty and draining would block
+                # forever.
+                if not eof:
+                    while read_q.get() is not None:
+                        pass
+            finally:
+                write_q.put(None)
+
+        def write_frames():
+            frame_num = 0
+            last_update = 0.0
+            try:
+                while True:
+                    frame = write_q.get()
+                    if frame is None:
+                        break
+                    out.write(frame)
+                    frame_num += 1
+                    # Throttle progress by wall time rather than frame
+                    # count: updates are for human eyes, so ~10 per second
+                    # is plenty at any frame rate.
+                    now = time.monotonic()
+                    if now - last_update > 0.1 or frame_num == total_frames:
+                        last_update = now
+                        progress = (frame_num / total_frames) * 100
+                        progress_callback(progress)
+            except Exception as e:
+                errors.append(e)
+                while write_q.get() is not None:
+                    pass
+
+        stages = [
+            threading.Thread(target=target, daemon=True)
+            for target in (read_frames, transform_frames, write_frames)
+        ]
+        for stage in stages:
+            stage.start()
+        for stage in stages:
+            stage.join()
+        if errors:
+            raise errors[0]
+        if backpressure[1] >= 10 and backpressure[0] / backpressure[1] > 0.5:
+            # Encode-bound run: compute spent most of the video waiting on
+            # the writer. Worth surfacing, since a hardware encoder (see
+            # _FFMPEG_ENCODERS) is the fix, not more compute threads.
+            print("trueBlinders: write queue stayed near capacity for "
+                  f"{backpressure[0]}/{backpressure[1]} batches; "
+                  "encoding is the bottleneck.")
+
         # Release resources
         cap.release()
         out.release()
@@ -128,9 +593,16 @@ class ColorblindFilterApp:
         self.filter1 = tk.StringVar(value="Protanopia")
         self.filter2 = tk.StringVar(value="None")
         self.filter3 = tk.StringVar(value="None")
-        
+
         # Create UI components
         self.create_widgets()
+
+        # Progress values are queued by the worker threads and applied here
+        # on the Tk thread; Tk is not thread-safe, so workers must never
+        # touch widgets directly.
+        self._progress_queue = queue.Queue()
+        self._last_percent = -1
+        self.root.after(50, self._poll_progress)
     
     def create_widgets(self):
         padding_options = {'padx': 10, 'pady': 10}
@@ -241,6 +713,7 @@ class ColorblindFilterApp:
             return
         
         # Disable the UI elements to prevent changes during processing
+        self._last_percent = -1
         self.disable_ui()
         
         # Start processing in a separate thread to keep the GUI responsive
@@ -251,14 +724,29 @@ class ColorblindFilterApp:
         processing_thread.start()
     
     def update_progress(self, progress):
-        # Update the progress bar
-        self.progress_bar.coords(self.progress_rect, 0, 0, 6 * progress, 25)  # 600px width
-        self.progress_label.config(text=f"Progress: {int(progress)}%")
-        self.root.update_idletasks()
-        
-        if progress >= 100:
-            # Re-enable the UI elements
-            self.enable_ui()
+        # Called from the worker threads: only queue the value, never touch
+        # Tk from here.
+        self._progress_queue.put(progress)
+
+    def _poll_progress(self):
+        # Drain everything queued since the last poll and render only the
+        # newest value, at whole-percent granularity.
+        progress = None
+        while True:
+            try:
+                progress = self._progress_queue.get_nowait()
+            except queue.Empty:
+                break
+        if progress is not None:
+            percent = int(progress)
+            if percent != self._last_percent:
+                self._last_percent = percent
+                self.progress_bar.coords(self.progress_rect, 0, 0, 6 * progress, 25)  # 600px width
+                self.progress_label.config(text=f"Progress: {percent}%")
+            if progress >= 100:
+                # Re-enable the UI elements
+                self.enable_ui()
+        self.root.after(50, self._poll_progress)
     
     def disable_ui(self):
         for child in self.root.winfo_children():